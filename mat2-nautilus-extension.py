@@ -18,17 +18,21 @@ Date: December 2025
 License: MIT
 """
 
+import glob
+import importlib.util
+import json
 import logging
 import os
+import shutil
+import stat
 import subprocess
-from typing import List, Optional
-from urllib.parse import unquote, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
 
-# Configure logging for the extension
-logging.basicConfig(
-    level=logging.WARNING,
-    format='%(name)s: %(levelname)s: %(message)s'
-)
+# Logging configuration is left to the host process; unconfigured,
+# Python still prints WARNING and above to stderr
 logger = logging.getLogger('mat2-nautilus')
 
 # Detect available Nautilus version
@@ -38,13 +42,42 @@ from gi import require_version
 NAUTILUS_VERSION = None
 _import_error = None
 
+
+def _installed_nautilus_versions() -> List[str]:
+    """List Nautilus typelib versions found in the standard GI paths.
+
+    Returns:
+        Version strings (e.g. '4.1'), newest first
+    """
+    versions = set()
+    for pattern in ('/usr/lib*/girepository-1.0/Nautilus-*.typelib',
+                    '/usr/lib/*/girepository-1.0/Nautilus-*.typelib'):
+        for typelib in glob.glob(pattern):
+            version = os.path.basename(typelib)[len('Nautilus-'):-len('.typelib')]
+            if all(part.isdigit() for part in version.split('.')):
+                versions.add(version)
+    return sorted(versions, key=lambda v: tuple(map(int, v.split('.'))), reverse=True)
+
+
+# Load only the installed version when the typelib can be located
+_installed_versions = _installed_nautilus_versions()
+if _installed_versions:
+    try:
+        require_version('Nautilus', _installed_versions[0])
+        from gi.repository import Nautilus, GObject, GLib
+        NAUTILUS_VERSION = int(_installed_versions[0].split('.')[0])
+    except (ValueError, ImportError) as e:
+        _import_error = e
+
+# Otherwise probe known versions (non-standard install)
 # Try Nautilus 4.1 (Debian 13/Trixie, Ubuntu 24.04+)
-try:
-    require_version('Nautilus', '4.1')
-    from gi.repository import Nautilus, GObject, GLib
-    NAUTILUS_VERSION = 4
-except (ValueError, ImportError):
-    pass
+if NAUTILUS_VERSION is None:
+    try:
+        require_version('Nautilus', '4.1')
+        from gi.repository import Nautilus, GObject, GLib
+        NAUTILUS_VERSION = 4
+    except (ValueError, ImportError):
+        pass
 
 # Try Nautilus 4.0 (older versions)
 if NAUTILUS_VERSION is None:
@@ -66,7 +99,7 @@ if NAUTILUS_VERSION is None:
 
 # If no version could be imported, create dummy class to avoid crash
 if NAUTILUS_VERSION is None:
-    logger.error(f"Could not import Nautilus: {_import_error}")
+    logger.error("Could not import Nautilus: %s", _import_error)
     logger.error("Extension will not be available.")
 
     # Create dummy classes so the file loads without error
@@ -91,9 +124,20 @@ if NAUTILUS_VERSION is None:
             pass
 
 
+# libmat2 is optional: without it we rely on the extension filter alone
+try:
+    from libmat2 import parser_factory
+    _HAS_LIBMAT2 = True
+except (ValueError, ImportError) as e:
+    # Parser modules call gi.require_version(), which raises ValueError
+    # when a typelib (Poppler, GdkPixbuf, Rsvg, ...) is missing
+    logger.debug("libmat2 not usable: %s", e)
+    _HAS_LIBMAT2 = False
+
+
 # File extensions commonly supported by mat2
 # Used for quick pre-filtering before expensive libmat2 check
-SUPPORTED_EXTENSIONS = {
+SUPPORTED_EXTENSIONS = frozenset({
     # Images
     '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp',
     '.heic', '.ppm', '.svg', '.svgz',
@@ -111,7 +155,253 @@ SUPPORTED_EXTENSIONS = {
     '.html', '.htm', '.shtml', '.xhtml', '.xht', '.css',
     # Text
     '.txt', '.text',
-}
+})
+
+# Extensions that unambiguously map to a mat2 parser; these skip the
+# libmat2 file probe. Containers (ogg, tar, ...) still get the deep check.
+_UNAMBIGUOUS_EXTS = frozenset({
+    # Images
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp',
+    # Documents
+    '.pdf', '.odt', '.ods', '.odp', '.odg', '.docx', '.xlsx', '.pptx', '.epub',
+    # Audio
+    '.mp3', '.flac', '.wav',
+    # Video
+    '.mp4', '.m4v', '.avi', '.wmv',
+    # Archives
+    '.zip', '.torrent',
+})
+
+# Files larger than this are not opened by the libmat2 probe while
+# building the menu (extension match is enough)
+_PROBE_MAX_SIZE = 64 * 1024 * 1024
+
+# Critical system directories that must never be cleaned
+_DANGEROUS_EXACT = frozenset(('/bin', '/sbin', '/usr', '/etc', '/var', '/boot', '/root'))
+_DANGEROUS_PREFIXES = tuple(p + os.sep for p in _DANGEROUS_EXACT)
+
+# mat2 already cleans the files of one run in parallel (one process per
+# CPU), so only a few runs go at once
+_MAX_MAT2_RUNS = 2
+
+# How mat2 continues its "[-] <file>..." per-file messages
+_MAT2_MESSAGE_SUFFIXES = ("'s format", " can't be cleaned:", " is not ", " doesn't exist")
+
+# Per-file cleaning outcomes (mirror mat2's exit codes 0 and 1)
+_CLEAN_OK = 0
+_CLEAN_UNSUPPORTED = 1
+_CLEAN_FAILED = 2
+
+# Remembers the last mat2 binary known to work, across Nautilus sessions
+_STATE_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'mat2-nautilus', 'state.json'
+)
+
+
+def _libmat2_state() -> Optional[Dict[str, Any]]:
+    """Identify the installed libmat2 package by location and mtime.
+
+    mat2 is a small script, so an upgraded or broken libmat2 does not
+    change the mat2 binary itself.
+
+    Returns:
+        Dict with 'origin', 'mtime' and 'usable' keys, or None if
+        libmat2 cannot be located
+    """
+    try:
+        spec = importlib.util.find_spec('libmat2')
+        if spec is None or spec.origin is None:
+            return None
+        return {'origin': spec.origin, 'mtime': os.stat(spec.origin).st_mtime,
+                'usable': _HAS_LIBMAT2}
+    except (ImportError, ValueError, OSError):
+        return None
+
+
+def _mat2_binary_state() -> Optional[Dict[str, Any]]:
+    """Identify the installed mat2 binary by path and modification time.
+
+    Returns:
+        Dict with 'path', 'mtime' and 'libmat2' keys, or None if mat2 is
+        not in PATH
+    """
+    path = shutil.which('mat2')
+    if path is None:
+        return None
+    try:
+        return {'path': path, 'mtime': os.stat(path).st_mtime,
+                'libmat2': _libmat2_state()}
+    except OSError:
+        return None
+
+
+def _read_state_cache() -> Optional[Dict[str, Any]]:
+    """Load the mat2 binary state saved by a previous session.
+
+    Returns:
+        The saved state, or None if there is no usable cache
+    """
+    try:
+        with open(_STATE_CACHE_FILE, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug("No usable state cache: %s", e)
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _write_state_cache(state: Dict[str, Any]) -> None:
+    """Save the state of a mat2 binary that passed the availability check.
+
+    Args:
+        state: Binary state as returned by _mat2_binary_state()
+    """
+    try:
+        os.makedirs(os.path.dirname(_STATE_CACHE_FILE), exist_ok=True)
+        with open(_STATE_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+    except OSError as e:
+        # Not critical: the check simply runs again next session
+        logger.debug("Could not write state cache: %s", e)
+
+
+def _clear_state_cache() -> None:
+    """Forget the saved mat2 binary state after a failed check."""
+    try:
+        os.remove(_STATE_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("Could not remove state cache: %s", e)
+
+
+def _dir_mtimes(directory: str) -> Dict[str, int]:
+    """Snapshot the modification times of a directory's entries.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Mapping of entry name to st_mtime_ns
+    """
+    with os.scandir(directory) as entries:
+        return {entry.name: entry.stat().st_mtime_ns for entry in entries}
+
+
+def _cleaned_name(path: str) -> str:
+    """Name of the copy mat2 creates for a file (name.cleaned.ext).
+
+    Args:
+        path: Path of the original file
+
+    Returns:
+        Base name of the cleaned copy
+    """
+    name = os.path.basename(path)
+    head, _, ext = name.rpartition('.')
+    return f"{head}.cleaned.{ext}" if head else name + '.cleaned'
+
+
+@lru_cache(maxsize=4096)
+def _realpath_cached(path: str) -> str:
+    """Resolve symlinks in a path (cached, paths repeat across menus).
+
+    Only for building menus: the result may be stale if a symlink changes.
+
+    Args:
+        path: Absolute path to resolve
+
+    Returns:
+        Canonical path as returned by os.path.realpath
+    """
+    return os.path.realpath(path)
+
+
+@lru_cache(maxsize=1024)
+def _uri_to_path(uri: str) -> Optional[str]:
+    """Convert a file URI to a system path (cached per URI).
+
+    Args:
+        uri: File URI (e.g., file:///home/user/file.pdf)
+
+    Returns:
+        System path or None if the URI is not a local file
+    """
+    parsed = urlsplit(uri)
+    if parsed.scheme != 'file':
+        return None
+    return unquote(parsed.path)
+
+
+@lru_cache(maxsize=1)
+def _load_notify() -> Optional[Any]:
+    """Import and initialise libnotify on first use (once per session).
+
+    Done lazily so Nautilus processes that never show a notification
+    don't get libnotify's process-wide app name set.
+
+    Returns:
+        The Notify module, or None if the bindings are not usable
+    """
+    try:
+        require_version('Notify', '0.7')
+        from gi.repository import Notify
+    except (ValueError, ImportError) as e:
+        logger.debug("libnotify bindings not available: %s", e)
+        return None
+    return Notify if Notify.init('mat2-nautilus') else None
+
+
+def _file_extension(path: str) -> str:
+    """Lowercase extension of a path, including the dot.
+
+    A tail containing os.sep never matches SUPPORTED_EXTENSIONS, so the
+    directory part does not need to be split off first.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Extension such as '.jpg', or '' if there is none
+    """
+    dot = path.rfind('.')
+    ext = path[dot:] if dot >= 0 else ''
+    # Extensions are usually lowercase already, so avoid the copy
+    return ext if ext.islower() else ext.lower()
+
+
+@lru_cache(maxsize=2048)
+def _is_supported(path: str, mtime_ns: int, size: int) -> bool:
+    """Check if a file is supported by mat2 (cached per path and mtime).
+
+    Args:
+        path: Path to the file
+        mtime_ns: Modification time of the file, used to invalidate the cache
+        size: Size of the file in bytes
+
+    Returns:
+        True if the file is supported by mat2
+    """
+    # Quick filter by extension
+    ext = _file_extension(path)
+    if ext not in SUPPORTED_EXTENSIONS:
+        return False
+
+    # Well-known formats and large files don't get the (file-opening)
+    # libmat2 probe, mat2 itself does the authoritative check when cleaning
+    if ext in _UNAMBIGUOUS_EXTS or size > _PROBE_MAX_SIZE or not _HAS_LIBMAT2:
+        return True
+
+    # For better accuracy, validate with libmat2
+    try:
+        parser, _ = parser_factory.get_parser(path)
+        return parser is not None
+    except (ValueError, Exception) as e:
+        # If the file is invalid, fall back to
+        # extension-based check (already passed)
+        logger.debug("libmat2 check failed for %s: %s", path, e)
+        return True  # Extension matched, assume supported
 
 
 class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
@@ -123,9 +413,18 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
         self._mat2_checked: bool = False
         self._mat2_available: Optional[bool] = None
 
+        # Trust the previous session's result while mat2 and libmat2 are
+        # unchanged; otherwise check lazily on the first right-click
+        binary = _mat2_binary_state()
+        if binary is not None and _read_state_cache() == binary:
+            self._mat2_checked = True
+            self._mat2_available = True
+
     def check_mat2_available(self) -> bool:
         """Check if mat2 is installed (lazy check, once per session).
 
+        A successful check is persisted so later sessions can skip it.
+
         Returns:
             True if mat2 is available, False otherwise
         """
@@ -136,7 +435,8 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
         try:
             result = subprocess.run(
                 ['mat2', '--version'],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=2
             )
             self._mat2_available = result.returncode == 0
@@ -145,72 +445,76 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
 
         if not self._mat2_available:
             logger.error("mat2 is not installed or not accessible")
+            _clear_state_cache()
+        else:
+            binary = _mat2_binary_state()
+            if binary is not None:
+                _write_state_cache(binary)
 
         return self._mat2_available
 
-    def validate_path(self, path: str) -> bool:
+    def validate_path(self, path: str, cached: bool = False,
+                      _isabs=os.path.isabs, _realpath=os.path.realpath,
+                      _realpath_cached=_realpath_cached, _sep=os.sep,
+                      _dangerous=_DANGEROUS_PREFIXES,
+                      _dangerous_exact=_DANGEROUS_EXACT) -> bool:
         """Validate that a path is safe (no traversal attacks).
 
+        Called for every selected file, so the helpers it needs are bound
+        as default arguments (fast local lookups); callers never pass them.
+
         Args:
             path: The path to validate
+            cached: Resolve symlinks through the session cache. Only for
+                building menus, the result may be stale
 
         Returns:
             True if the path is safe, False otherwise
         """
         # Must be absolute path
-        if not os.path.isabs(path):
-            logger.warning(f"Path validation failed: not absolute: {path}")
+        if not _isabs(path):
+            logger.warning("Path validation failed: not absolute: %s", path)
             return False
 
         # Resolve the path to catch symlink attacks
         try:
-            resolved = os.path.realpath(path)
+            resolved = _realpath_cached(path) if cached else _realpath(path)
         except (OSError, ValueError) as e:
-            logger.warning(f"Path validation failed: cannot resolve: {e}")
+            logger.warning("Path validation failed: cannot resolve: %s", e)
             return False
 
         # Check for path traversal (.. components after resolution)
-        if '..' in resolved.split(os.sep):
-            logger.warning(f"Path validation failed: traversal detected: {path}")
+        if '..' in resolved.split(_sep):
+            logger.warning("Path validation failed: traversal detected: %s", path)
             return False
 
         # Don't allow operations on critical system directories
-        dangerous_prefixes = ['/bin', '/sbin', '/usr', '/etc', '/var', '/boot', '/root']
-        for prefix in dangerous_prefixes:
-            if resolved.startswith(prefix + os.sep) or resolved == prefix:
-                logger.warning(f"Path validation failed: system directory: {resolved}")
-                return False
+        if resolved.startswith(_dangerous) or resolved in _dangerous_exact:
+            logger.warning("Path validation failed: system directory: %s", resolved)
+            return False
 
         return True
 
-    def is_file_supported(self, path: str) -> bool:
+    def is_file_supported(self, path: str,
+                          st: Optional[os.stat_result] = None) -> bool:
         """Check if a file is supported by mat2.
 
         Uses quick extension check first, then validates with libmat2 if needed.
+        Results are cached per (path, mtime) so repeated menus are cheap.
 
         Args:
             path: Path to the file
+            st: Result of os.stat(path) if the caller already has it
 
         Returns:
             True if the file is supported by mat2
         """
-        # Quick filter by extension
-        _, ext = os.path.splitext(path)
-        ext = ext.lower()
-
-        if ext not in SUPPORTED_EXTENSIONS:
-            return False
-
-        # For better accuracy, validate with libmat2
-        try:
-            from libmat2 import parser_factory
-            parser, _ = parser_factory.get_parser(path)
-            return parser is not None
-        except (ImportError, ValueError, Exception) as e:
-            # If libmat2 is not available or file is invalid,
-            # fall back to extension-based check (already passed)
-            logger.debug(f"libmat2 check failed for {path}: {e}")
-            return True  # Extension matched, assume supported
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+        return _is_supported(path, st.st_mtime_ns, st.st_size)
 
     def get_path_from_uri(self, uri: str) -> Optional[str]:
         """Convert a file URI to a system path.
@@ -222,13 +526,9 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
             System path or None if conversion fails
         """
         try:
-            parsed = urlparse(uri)
-            if parsed.scheme != 'file':
-                return None
-            path = unquote(parsed.path)
-            return path
+            return _uri_to_path(uri)
         except (ValueError, TypeError) as e:
-            logger.warning(f"URI parsing error: {e}")
+            logger.warning("URI parsing error: %s", e)
             return None
 
     def get_file_items(self, *args) -> List:
@@ -267,19 +567,29 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
         if not files:
             return []
 
-        # Convert URIs to paths and filter
-        paths = []
+        # Convert URIs to paths
+        candidate_paths = []
         for file_info in files:
             if hasattr(file_info, 'get_uri'):
-                uri = file_info.get_uri()
-                path = self.get_path_from_uri(uri)
+                path = self.get_path_from_uri(file_info.get_uri())
+                if path:
+                    candidate_paths.append(path)
 
-                # Only include valid, supported files
-                if (path and
-                    os.path.isfile(path) and
-                    self.validate_path(path) and
-                    self.is_file_supported(path)):
-                    paths.append(path)
+        # Cheap extension filter in one pass, before touching the disk
+        candidate_paths = [path for path in candidate_paths
+                           if _file_extension(path) in SUPPORTED_EXTENSIONS]
+
+        # Only include valid, supported files (one stat per file)
+        paths = []
+        for path in candidate_paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if (stat.S_ISREG(st.st_mode) and
+                    self.validate_path(path, cached=True) and
+                    self.is_file_supported(path, st)):
+                paths.append(path)
 
         if not paths:
             return []
@@ -334,9 +644,136 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
         # Delay to let context menu close and transfer focus
         GLib.timeout_add(150, self._do_clean_metadata, paths)
 
+    def _clean_one(self, path: str) -> Tuple[int, Optional[str]]:
+        """Clean a single file with mat2.
+
+        Safe to run from a worker thread: it only touches its own file.
+
+        Args:
+            path: Path of the file to clean
+
+        Returns:
+            Tuple of (status, cleaned file name or None), where status is
+            one of _CLEAN_OK, _CLEAN_UNSUPPORTED or _CLEAN_FAILED
+        """
+        try:
+            # Run mat2 (creates filename.cleaned.ext by default)
+            result = subprocess.run(
+                ['mat2', '--unknown-members', 'omit', path],
+                capture_output=True,
+                text=True,
+                timeout=300  # 5 minutes max per file
+            )
+        except subprocess.TimeoutExpired:
+            logger.error("Timeout cleaning: %s", path)
+            return _CLEAN_FAILED, None
+        except OSError as e:
+            logger.error("OS error cleaning %s: %s", path, e)
+            return _CLEAN_FAILED, None
+
+        if result.returncode == 0:
+            logger.info("Cleaned metadata: %s", path)
+            # mat2 exited cleanly, so the cleaned copy exists
+            return _CLEAN_OK, _cleaned_name(path)
+
+        if result.returncode == 1:
+            # Format not supported (not an error per mat2 design)
+            logger.info("Format not supported by mat2: %s", path)
+            return _CLEAN_UNSUPPORTED, None
+
+        # mat2 reports per-file errors on stdout
+        error_msg = (result.stdout or result.stderr or "").strip() or "Unknown error"
+        logger.error("mat2 failed on %s: %s", path, error_msg)
+        return _CLEAN_FAILED, None
+
+    def _clean_batch(self, paths: List[str]) -> List[Tuple[int, Optional[str]]]:
+        """Clean several files from the same directory with one mat2 run.
+
+        Amortizes mat2's interpreter startup over the whole batch. If mat2
+        exits cleanly every file was cleaned; otherwise per-file outcomes
+        are recovered from the *.cleaned.* files this run wrote and mat2's
+        per-file messages. Files the batch run left uncleaned without
+        explanation are retried with one mat2 run each.
+
+        Args:
+            paths: Paths of the files to clean, all in the same directory
+
+        Returns:
+            One (status, cleaned file name or None) tuple per path, in order
+        """
+        if len(paths) == 1:
+            return [self._clean_one(paths[0])]
+
+        directory = os.path.dirname(paths[0])
+        try:
+            before = _dir_mtimes(directory)
+            result = subprocess.run(
+                ['mat2', '--unknown-members', 'omit', *paths],
+                capture_output=True,
+                text=True,
+                timeout=300 * len(paths)  # 5 minutes max per file
+            )
+            after = _dir_mtimes(directory)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning("Batched mat2 run failed (%s), cleaning files one by one", e)
+            return [self._clean_one(path) for path in paths]
+
+        if result.returncode == 0:
+            for path in paths:
+                logger.info("Cleaned metadata: %s", path)
+            return [(_CLEAN_OK, _cleaned_name(path)) for path in paths]
+
+        # Only output written by this run counts, not copies left over
+        # from an earlier clean
+        produced = {name for name, mtime_ns in after.items()
+                    if before.get(name) != mtime_ns}
+
+        # mat2 prints its per-file "[-] ..." messages to stdout
+        errors = (result.stdout or '').splitlines() + (result.stderr or '').splitlines()
+        file_messages: Dict[str, List[str]] = {}
+        for line in errors:
+            matches = [path for path in paths
+                       if line.startswith('[-] ' + path) and
+                       line[len(path) + 4:].startswith(_MAT2_MESSAGE_SUFFIXES)]
+            if matches:
+                # "a.jpg" must not claim the messages of "a.jpg b.jpg"
+                file_messages.setdefault(max(matches, key=len), []).append(line)
+
+        attributed = False
+        results: List[Tuple[int, Optional[str]]] = []
+        for path in paths:
+            cleaned_name = _cleaned_name(path)
+            messages = file_messages.get(path)
+            if messages:
+                attributed = True
+                if any('not supported' in line for line in messages):
+                    logger.info("Format not supported by mat2: %s", path)
+                    results.append((_CLEAN_UNSUPPORTED, None))
+                else:
+                    logger.error("mat2 failed on %s: %s", path, messages[-1].strip())
+                    results.append((_CLEAN_FAILED, None))
+            elif cleaned_name in produced:
+                logger.info("Cleaned metadata: %s", path)
+                results.append((_CLEAN_OK, cleaned_name))
+            else:
+                results.append((_CLEAN_FAILED, None))
+
+        if result.returncode != 0 and not attributed:
+            # Global error: nothing points at a specific file, so retry
+            # the files that were not cleaned
+            logger.warning("Batched mat2 run failed, cleaning remaining files one by one")
+            return [outcome if outcome[0] == _CLEAN_OK else self._clean_one(path)
+                    for path, outcome in zip(paths, results)]
+
+        return results
+
     def _do_clean_metadata(self, paths: List[str]) -> bool:
         """Perform the actual metadata cleaning operation.
 
+        Files are grouped by directory into one mat2 run per group, and the
+        groups are cleaned in parallel. Cleaning always happens in a mat2
+        subprocess so a hanging or crashing parser cannot take Nautilus down.
+
         Args:
             paths: List of file paths to clean
 
@@ -348,53 +785,41 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
         unsupported_count = 0
         cleaned_files = []
 
+        # Double-check path validation once, before any cleaning starts
+        # (uncached, to catch symlinks re-pointed since the menu was built)
+        valid_paths = []
         for path in paths:
-            # Double-check path validation
             if not self.validate_path(path):
-                logger.warning(f"Skipping invalid path: {path}")
+                logger.warning("Skipping invalid path: %s", path)
                 failed_count += 1
-                continue
-
-            if not os.path.isfile(path):
-                logger.warning(f"Skipping non-file: {path}")
+            elif not os.path.isfile(path):
+                logger.warning("Skipping non-file: %s", path)
                 failed_count += 1
-                continue
-
-            try:
-                # Run mat2 (creates filename.cleaned.ext by default)
-                result = subprocess.run(
-                    ['mat2', '--unknown-members', 'omit', path],
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minutes max per file
-                )
-
-                if result.returncode == 0:
-                    success_count += 1
-                    # Determine the cleaned filename
-                    base, ext = os.path.splitext(path)
-                    cleaned_path = f"{base}.cleaned{ext}"
-                    if os.path.exists(cleaned_path):
-                        cleaned_files.append(os.path.basename(cleaned_path))
-                    logger.info(f"Cleaned metadata: {path}")
-
-                elif result.returncode == 1:
-                    # Format not supported (not an error per mat2 design)
-                    unsupported_count += 1
-                    logger.info(f"Format not supported by mat2: {path}")
-
-                else:
-                    failed_count += 1
-                    error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                    logger.error(f"mat2 failed on {path}: {error_msg}")
-
-            except subprocess.TimeoutExpired:
-                failed_count += 1
-                logger.error(f"Timeout cleaning: {path}")
+            else:
+                valid_paths.append(path)
+        paths = valid_paths
 
-            except OSError as e:
+        groups: Dict[str, List[str]] = {}
+        for path in paths:
+            groups.setdefault(os.path.dirname(path), []).append(path)
+
+        results = []
+        if groups:
+            # Threads are enough: the GIL is released while waiting on mat2
+            workers = min(len(groups), _MAX_MAT2_RUNS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch_results in executor.map(self._clean_batch, groups.values()):
+                    results.extend(batch_results)
+
+        for status, cleaned_name in results:
+            if status == _CLEAN_OK:
+                success_count += 1
+                if cleaned_name:
+                    cleaned_files.append(cleaned_name)
+            elif status == _CLEAN_UNSUPPORTED:
+                unsupported_count += 1
+            else:
                 failed_count += 1
-                logger.error(f"OS error cleaning {path}: {e}")
 
         # Show notification with results
         self._show_results(success_count, unsupported_count, failed_count, cleaned_files)
@@ -449,15 +874,25 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
             title: Notification title
             message: Notification message
         """
+        # In-process D-Bus call when libnotify bindings are available
+        Notify = _load_notify()
+        if Notify is not None:
+            try:
+                Notify.Notification.new(title, message, 'edit-clear-all').show()
+                return
+            except Exception as e:
+                logger.debug("libnotify failed, falling back to notify-send: %s", e)
+
         try:
             subprocess.run(
                 ['notify-send', '-i', 'edit-clear-all', title, message],
                 timeout=2,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
             # Silence notification errors - they are not critical
-            logger.debug(f"Could not show notification: {title}")
+            logger.debug("Could not show notification: %s", title)
 
     def show_error(self, title: str, message: str) -> None:
         """Show an error dialog using zenity.
@@ -473,8 +908,9 @@ class Mat2CleanerExtension(GObject.GObject, Nautilus.MenuProvider):
                  '--text', message,
                  '--width', '400'],
                 timeout=60,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
             # Fallback to logger if zenity is not available
-            logger.error(f"Dialog error: {title} - {message}")
+            logger.error("Dialog error: %s - %s", title, message)